@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import api from '../services/api';
 import Layout from '../components/Layout';
@@ -7,6 +7,7 @@ import { Badge } from '../components/Badge';
 import { CommissionBadge } from '../components/CommissionBadge';
 import { Modal } from '../components/Modal';
 import { Button } from '../components/Button';
+import { monthlyPayment as calcMonthlyPayment } from '../utils/mortgage';
 
 interface FinancingOffer {
   id: string;
@@ -86,27 +87,30 @@ export const Financing: React.FC = () => {
     },
   });
 
-  const calculateMonthlyPayment = () => {
+  // Compute all loan scenario metrics in a single memoized pass so the
+  // amortization math runs once per input change instead of once per
+  // rendered value
+  const calcResults = useMemo(() => {
     const principal = parseFloat(calcValues.loanAmount);
     const rate = parseFloat(calcValues.interestRate) / 100 / 12;
     const term = parseFloat(calcValues.termMonths);
 
-    if (!principal || !rate || !term) return 0;
+    // Reject only missing/invalid input - a 0% rate is valid and prices
+    // at principal/termMonths via monthlyPayment's zero-rate path
+    if (!principal || !term || Number.isNaN(rate)) {
+      return { monthlyPayment: 0, totalInterest: 0, totalPayment: 0, commission: 0 };
+    }
 
-    const monthlyPayment =
-      (principal * rate * Math.pow(1 + rate, term)) / (Math.pow(1 + rate, term) - 1);
-    return monthlyPayment;
-  };
+    const monthlyPayment = calcMonthlyPayment(principal, rate, term);
+    const totalPayment = monthlyPayment * term;
 
-  const calculateTotalInterest = () => {
-    const principal = parseFloat(calcValues.loanAmount);
-    const term = parseFloat(calcValues.termMonths);
-    const monthly = calculateMonthlyPayment();
-    
-    if (!monthly) return 0;
-    
-    return monthly * term - principal;
-  };
+    return {
+      monthlyPayment,
+      totalInterest: totalPayment - principal,
+      totalPayment,
+      commission: principal * 0.02,
+    };
+  }, [calcValues.loanAmount, calcValues.interestRate, calcValues.termMonths]);
 
   const formatCurrency = (amount: number) => {
     return new Intl.NumberFormat('en-US', {
@@ -435,27 +439,25 @@ export const Financing: React.FC = () => {
                 <div className="flex justify-between">
                   <span className="text-gray-600">Monthly Payment:</span>
                   <span className="font-bold text-lg">
-                    {formatCurrency(calculateMonthlyPayment())}
+                    {formatCurrency(calcResults.monthlyPayment)}
                   </span>
                 </div>
                 <div className="flex justify-between">
                   <span className="text-gray-600">Total Interest:</span>
                   <span className="font-medium">
-                    {formatCurrency(calculateTotalInterest())}
+                    {formatCurrency(calcResults.totalInterest)}
                   </span>
                 </div>
                 <div className="flex justify-between">
                   <span className="text-gray-600">Total Payment:</span>
                   <span className="font-medium">
-                    {formatCurrency(
-                      parseFloat(calcValues.loanAmount) + calculateTotalInterest()
-                    )}
+                    {formatCurrency(calcResults.totalPayment)}
                   </span>
                 </div>
                 <div className="flex justify-between pt-2 border-t">
                   <span className="text-gray-600">Estimated Commission (2%):</span>
                   <span className="font-bold text-green-600">
-                    {formatCurrency(parseFloat(calcValues.loanAmount) * 0.02)}
+                    {formatCurrency(calcResults.commission)}
                   </span>
                 </div>
               </div>
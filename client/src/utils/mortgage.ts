@@ -0,0 +1,10 @@
+// Closed-form loan math shared by financing views.
+// rate is the periodic (monthly) rate, term is in months.
+
+export function monthlyPayment(principal: number, rate: number, termMonths: number): number {
+  // Exact-zero check only; for any nonzero rate the expm1 form below
+  // converges smoothly to principal/termMonths as the rate approaches 0,
+  // where the naive growth/(growth-1) ratio loses all precision
+  if (rate === 0) return principal / termMonths;
+  return (principal * rate) / -Math.expm1(-termMonths * Math.log1p(rate));
+}
@@ -0,0 +1,136 @@
+/**
+ * Express App Factory
+ * Builds the fully-wired app (middleware, health checks, API routes, static
+ * serving, error handlers) without binding a port or touching the database,
+ * so tests and tooling can construct an app instance cheaply.
+ */
+
+import express from 'express';
+import cors from 'cors';
+import helmet from 'helmet';
+import compression from 'compression';
+import routes from './routes';
+import { notFoundHandler, errorHandler } from './middleware/errorHandler';
+import { config } from './config';
+
+export interface CreateAppOptions {
+  /** Reports current database connectivity for the health endpoints */
+  isDbConnected?: () => boolean;
+}
+
+export function createApp(options: CreateAppOptions = {}): express.Express {
+  const isDbConnected = options.isDbConnected ?? (() => false);
+
+  const app = express();
+
+  // Trust proxy for Cloud Run (needed for rate limiting)
+  app.set('trust proxy', 1);
+
+  // Security middleware
+  app.use(helmet({
+    contentSecurityPolicy: false, // Disabled for SPA
+    crossOriginEmbedderPolicy: false,
+  }));
+
+  // Compression for faster responses
+  app.use(compression());
+
+  // CORS configuration
+  // Supports comma-separated origins for production (e.g., "https://app1.com,https://app2.com")
+  // Or single origin, or '*' for development
+  const corsOrigin = config.server.corsOrigin;
+  const corsOptions: cors.CorsOptions = {
+    origin: corsOrigin.includes(',')
+      ? corsOrigin.split(',').map((o: string) => o.trim()) // Multiple origins
+      : corsOrigin === '*'
+        ? true // Allow all in development
+        : corsOrigin, // Single origin
+    credentials: true,
+  };
+
+  app.use(cors(corsOptions));
+
+  // Body parsing
+  app.use(express.json({ limit: '10mb' }));
+  app.use(express.urlencoded({ extended: true }));
+
+  // Request logging with correlation IDs and structured logging
+  app.use((req, res, next) => {
+    const start = Date.now();
+    const correlationId = req.headers['x-correlation-id'] || `${Date.now()}-${Math.random().toString(36).substring(7)}`;
+
+    // Add correlation ID to request for downstream use
+    (req as any).correlationId = correlationId;
+    res.setHeader('X-Correlation-ID', correlationId);
+
+    res.on('finish', () => {
+      const duration = Date.now() - start;
+      // Structured logging for Cloud Logging
+      const logEntry = {
+        timestamp: new Date().toISOString(),
+        severity: res.statusCode >= 500 ? 'ERROR' : res.statusCode >= 400 ? 'WARNING' : 'INFO',
+        correlationId,
+        httpRequest: {
+          requestMethod: req.method,
+          requestUrl: req.path,
+          status: res.statusCode,
+          latency: `${duration}ms`,
+          userAgent: req.headers['user-agent'],
+          remoteIp: req.ip,
+        },
+      };
+      console.log(JSON.stringify(logEntry));
+    });
+    next();
+  });
+
+  // Root health check (for Cloud Run)
+  // Environment/API-key state is read from the cached config singleton instead of
+  // re-reading process.env on every request
+  app.get('/health', (req, res) => {
+    res.json({
+      status: 'healthy',
+      timestamp: new Date().toISOString(),
+      database: isDbConnected() ? 'connected' : 'disconnected',
+      environment: config.server.nodeEnv
+    });
+  });
+
+  // API health check with more details
+  app.get('/api/health', (req, res) => {
+    res.json({
+      success: true,
+      status: 'healthy',
+      timestamp: new Date().toISOString(),
+      services: {
+        database: isDbConnected() ? 'connected' : 'disconnected',
+        tavily: !!config.api.tavilyKey,
+        gemini: !!config.api.geminiKey,
+        maps: !!config.api.mapsKey
+      },
+      environment: config.server.nodeEnv,
+      version: '3.0.0'
+    });
+  });
+
+  // API routes
+  app.use('/api', routes);
+
+  // Serve static files (both dev and production)
+  const staticPath = config.server.nodeEnv === 'production' ? 'public' : '../client/dist';
+  app.use(express.static(staticPath));
+
+  // SPA fallback
+  app.get('*', (req, res, next) => {
+    if (req.path.startsWith('/api')) {
+      return next();
+    }
+    res.sendFile('index.html', { root: staticPath });
+  });
+
+  // Error handlers
+  app.use(notFoundHandler);
+  app.use(errorHandler);
+
+  return app;
+}
@@ -4,9 +4,8 @@
  * Validates required variables on startup
  */
 
-// Load environment variables at the very start
-import dotenv from 'dotenv';
-dotenv.config();
+// Environment variables are loaded once by the process entrypoint
+// (src/index.ts or the audit script) before this module is imported
 
 interface DatabaseConfig {
   url: string;
@@ -36,6 +35,7 @@ interface ServerConfig {
 interface CacheConfig {
   ttlMinutes: number;
   maxSize: number;
+  persistPath: string | null;
 }
 
 interface RateLimitConfig {
@@ -85,11 +85,13 @@ class ConfigService {
       api: {
         tavilyKey: process.env.TAVILY_API_KEY || null,
         geminiKey: process.env.GEMINI_API_KEY || null,
-        mapsKey: process.env.MAPS_API_KEY || null,
+        mapsKey: process.env.MAPS_API_KEY || process.env.VITE_MAPS_API_KEY || null,
       },
       cache: {
         ttlMinutes: parseInt(process.env.CACHE_TTL_MINUTES || '60', 10),
         maxSize: parseInt(process.env.CACHE_MAX_SIZE || '1000', 10),
+        // Optional snapshot file so the cache survives restarts (off by default)
+        persistPath: process.env.CACHE_PERSIST_PATH || null,
       },
       rateLimit: {
         windowMs: parseInt(process.env.RATE_LIMIT_WINDOW_MS || '900000', 10), // 15 min
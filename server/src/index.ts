@@ -1,19 +1,14 @@
 /**
  * Contractorv3 - Server Entry Point
- * Clean, modular architecture with AI-powered lead intelligence
+ * Bootstraps the app built by the factory in app.ts: validates config,
+ * binds the port, connects the database, and handles shutdown signals
  */
 
 // Load environment variables from .env file (for local development)
 // In production (Cloud Run), environment variables are set via --set-env-vars and --set-secrets
 import 'dotenv/config';
 
-import express from 'express';
-import cors from 'cors';
-import helmet from 'helmet';
-import compression from 'compression';
-import bcrypt from 'bcryptjs';
-import routes from './routes';
-import { notFoundHandler, errorHandler } from './middleware/errorHandler';
+import { createApp } from './app';
 import prisma from './lib/prisma';
 import { config } from './config';
 
@@ -60,8 +55,11 @@ async function createDemoUser() {
     const existing = await prisma.user.findUnique({
       where: { email: DEMO_USER.email },
     });
-    
+
     if (!existing) {
+      // Loaded lazily - hashing is only needed the first time the demo
+      // user is created, so keep bcrypt off the boot path
+      const bcrypt = require('bcryptjs') as typeof import('bcryptjs');
       const passwordHash = await bcrypt.hash(DEMO_USER.password, 10);
       await prisma.user.create({
         data: {
@@ -81,115 +79,9 @@ async function createDemoUser() {
   }
 }
 
-// Create Express app
-const app = express();
-
-// Trust proxy for Cloud Run (needed for rate limiting)
-app.set('trust proxy', 1);
-
-// Security middleware
-app.use(helmet({
-  contentSecurityPolicy: false, // Disabled for SPA
-  crossOriginEmbedderPolicy: false,
-}));
-
-// Compression for faster responses
-app.use(compression());
-
-// CORS configuration
-// Supports comma-separated origins for production (e.g., "https://app1.com,https://app2.com")
-// Or single origin, or '*' for development
-const corsOrigin = config.server.corsOrigin;
-const corsOptions: cors.CorsOptions = {
-  origin: corsOrigin.includes(',') 
-    ? corsOrigin.split(',').map((o: string) => o.trim()) // Multiple origins
-    : corsOrigin === '*' 
-      ? true // Allow all in development
-      : corsOrigin, // Single origin
-  credentials: true,
-};
-
-app.use(cors(corsOptions));
-
-// Body parsing
-app.use(express.json({ limit: '10mb' }));
-app.use(express.urlencoded({ extended: true }));
-
-// Request logging with correlation IDs and structured logging
-app.use((req, res, next) => {
-  const start = Date.now();
-  const correlationId = req.headers['x-correlation-id'] || `${Date.now()}-${Math.random().toString(36).substring(7)}`;
-  
-  // Add correlation ID to request for downstream use
-  (req as any).correlationId = correlationId;
-  res.setHeader('X-Correlation-ID', correlationId);
-  
-  res.on('finish', () => {
-    const duration = Date.now() - start;
-    // Structured logging for Cloud Logging
-    const logEntry = {
-      timestamp: new Date().toISOString(),
-      severity: res.statusCode >= 500 ? 'ERROR' : res.statusCode >= 400 ? 'WARNING' : 'INFO',
-      correlationId,
-      httpRequest: {
-        requestMethod: req.method,
-        requestUrl: req.path,
-        status: res.statusCode,
-        latency: `${duration}ms`,
-        userAgent: req.headers['user-agent'],
-        remoteIp: req.ip,
-      },
-    };
-    console.log(JSON.stringify(logEntry));
-  });
-  next();
-});
-
-// Root health check (for Cloud Run)
-app.get('/health', (req, res) => {
-  res.json({ 
-    status: 'healthy', 
-    timestamp: new Date().toISOString(),
-    database: dbConnected ? 'connected' : 'disconnected',
-    environment: process.env.NODE_ENV || 'development'
-  });
-});
-
-// API health check with more details
-app.get('/api/health', (req, res) => {
-  res.json({ 
-    success: true,
-    status: 'healthy', 
-    timestamp: new Date().toISOString(),
-    services: {
-      database: dbConnected ? 'connected' : 'disconnected',
-      tavily: !!process.env.TAVILY_API_KEY,
-      gemini: !!process.env.GEMINI_API_KEY,
-      maps: !!(process.env.MAPS_API_KEY || process.env.VITE_MAPS_API_KEY)
-    },
-    environment: process.env.NODE_ENV || 'development',
-    version: '3.0.0'
-  });
-});
-
-// API routes
-app.use('/api', routes);
-
-// Serve static files (both dev and production)
-const staticPath = process.env.NODE_ENV === 'production' ? 'public' : '../client/dist';
-app.use(express.static(staticPath));
-
-// SPA fallback
-app.get('*', (req, res, next) => {
-  if (req.path.startsWith('/api')) {
-    return next();
-  }
-  res.sendFile('index.html', { root: staticPath });
-});
-
-// Error handlers
-app.use(notFoundHandler);
-app.use(errorHandler);
+// Create Express app via the factory; health endpoints read connectivity
+// through the callback so they always reflect current state
+const app = createApp({ isDbConnected: () => dbConnected });
 
 // Start server
 const PORT = Number(process.env.PORT) || 8080;
@@ -199,7 +91,7 @@ async function main() {
     // Start server FIRST (for Cloud Run health checks)
     const server = app.listen(PORT, '0.0.0.0', () => {
       console.log(`🚀 Server running on port ${PORT}`);
-      
+
       // Log safe configuration
       console.log('\n📋 Configuration:');
       const safeConfig = config.getSafeConfig();
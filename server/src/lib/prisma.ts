@@ -4,8 +4,8 @@
  * With enhanced logging and error handling
  */
 
-// Load environment variables BEFORE Prisma initialization
-import 'dotenv/config';
+// Environment variables are loaded by the process entrypoint before this
+// module is imported, so DATABASE_URL is already set here
 import { PrismaClient } from '@prisma/client';
 
 // Type definitions for Prisma events
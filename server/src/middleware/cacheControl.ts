@@ -0,0 +1,19 @@
+/**
+ * Cache-Control Middleware
+ * Marks idempotent GET responses as briefly cacheable. Express already
+ * emits ETags and answers If-None-Match with 304, but without a
+ * Cache-Control header clients revalidate on every request; a short
+ * private max-age lets them skip the round trip entirely.
+ */
+
+import { Request, Response, NextFunction } from 'express';
+
+/**
+ * Allow private (per-user) caching of the response for `seconds`
+ */
+export function cacheControl(seconds: number) {
+  return (_req: Request, res: Response, next: NextFunction): void => {
+    res.set('Cache-Control', `private, max-age=${seconds}`);
+    next();
+  };
+}
@@ -3,6 +3,9 @@
  * Tests property search, scoring, and API reliability
  */
 
+// Entrypoint: load .env before any service modules read process.env
+import 'dotenv/config';
+
 import { ReliabilityAuditor, AuditIssue } from './ReliabilityAuditor';
 import { PropertyAnalyzerService } from '../services/PropertyAnalyzer';
 import { LeadIntelligenceService } from '../services/leads/LeadIntelligenceService';
@@ -184,17 +187,22 @@ async function runAudit() {
 
   const auditor = new ReliabilityAuditor();
 
+  // Shared service instances - constructed once rather than per run, so
+  // repeated runs measure the pipeline instead of setup cost
+  const analyzer = new PropertyAnalyzerService(
+    process.env.TAVILY_API_KEY,
+    process.env.GEMINI_API_KEY,
+    { ttlMinutes: 0 }  // Disable cache for testing
+  );
+  const leadIntel = new LeadIntelligenceService();
+  const tavily = new TavilyProvider(process.env.TAVILY_API_KEY);
+  const gemini = new GeminiProvider(process.env.GEMINI_API_KEY);
+
   // Test 1: Property Search Reliability
   await auditor.runTest({
     name: 'Property Search Reliability',
     runs: TEST_RUNS,
     execute: async () => {
-      const analyzer = new PropertyAnalyzerService(
-        process.env.TAVILY_API_KEY,
-        process.env.GEMINI_API_KEY,
-        { ttlMinutes: 0 }  // Disable cache for testing
-      );
-
       const result = await analyzer.analyzeProperty({
         address: TEST_ADDRESS,
         skipCache: true,
@@ -226,7 +234,6 @@ async function runAudit() {
     name: 'Lead Intelligence Reliability',
     runs: TEST_RUNS,
     execute: async () => {
-      const leadIntel = new LeadIntelligenceService();
       const result = await leadIntel.generateLeadIntelligence(TEST_ADDRESS);
       return result;
     },
@@ -275,7 +282,6 @@ async function runAudit() {
     name: 'Search Provider Reliability',
     runs: TEST_RUNS,
     execute: async () => {
-      const tavily = new TavilyProvider(process.env.TAVILY_API_KEY);
       const result = await tavily.searchPropertyListings(TEST_ADDRESS);
       return result;
     },
@@ -313,8 +319,6 @@ async function runAudit() {
     name: 'AI Provider Reliability',
     runs: TEST_RUNS,
     execute: async () => {
-      const gemini = new GeminiProvider(process.env.GEMINI_API_KEY);
-      
       // Use a fixed search result for consistent input
       const mockSearchResults = [
         {
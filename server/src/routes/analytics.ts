@@ -4,7 +4,9 @@
  */
 
 import { Router } from 'express';
+import { z } from 'zod';
 import { authenticate } from '../middleware/auth';
+import { validateQuery } from '../middleware/validation';
 import { asyncHandler } from '../middleware/errorHandler';
 import prisma from '../lib/prisma';
 
@@ -12,6 +14,10 @@ const router = Router();
 
 router.use(authenticate);
 
+const revenueQuerySchema = z.object({
+  months: z.coerce.number().int().min(1).max(36).default(6),
+});
+
 // GET /api/analytics/dashboard - User dashboard stats
 router.get('/dashboard', asyncHandler(async (req, res) => {
   const userId = req.user!.userId;
@@ -103,48 +109,50 @@ router.get('/dashboard', asyncHandler(async (req, res) => {
 }));
 
 // GET /api/analytics/revenue - Revenue data with breakdown
-router.get('/revenue', asyncHandler(async (req, res) => {
+router.get('/revenue', validateQuery(revenueQuerySchema), asyncHandler(async (req, res) => {
   const userId = req.user!.userId;
-  const months = parseInt(req.query.months as string) || 6;
+  const { months } = req.query as any;
 
   const startDate = new Date();
   startDate.setMonth(startDate.getMonth() - months);
 
-  // Get invoices with project info
+  // Fetch only the fields the aggregation reads, not whole invoice rows
   const invoices = await prisma.invoice.findMany({
-    where: { 
+    where: {
       userId,
       createdAt: { gte: startDate },
     },
+    select: { projectId: true, amountPaid: true, createdAt: true },
   });
 
   // Get projects for type info
-  const projectIds = invoices.map(inv => inv.projectId).filter(Boolean) as string[];
+  const projectIds = [];
+  for (const inv of invoices) {
+    if (inv.projectId) projectIds.push(inv.projectId);
+  }
   const projects = await prisma.project.findMany({
     where: { id: { in: projectIds } },
     select: { id: true, name: true }
   });
   const projectMap = new Map(projects.map(p => [p.id, p]));
 
-  // Calculate total revenue
-  const total = invoices.reduce((sum, inv) => sum + (inv.amountPaid || 0), 0);
-
-  // Revenue by project type (using project name as type for now)
+  // Accumulate total, by-type and by-month in a single pass over the rows
+  let total = 0;
   const byProjectType: Record<string, number> = {};
+  const byMonth: { month: string; revenue: number }[] = [];
+  const monthMap: Record<string, number> = {};
+
   invoices.forEach(inv => {
+    const paid = inv.amountPaid || 0;
+    total += paid;
+
     const project = inv.projectId ? projectMap.get(inv.projectId) : null;
     const type = project?.name || 'Other';
-    byProjectType[type] = (byProjectType[type] || 0) + (inv.amountPaid || 0);
-  });
+    byProjectType[type] = (byProjectType[type] || 0) + paid;
 
-  // Revenue by month
-  const byMonth: { month: string; revenue: number }[] = [];
-  const monthMap: Record<string, number> = {};
-  
-  invoices.forEach(inv => {
-    if (inv.amountPaid) {
+    if (paid) {
       const monthKey = inv.createdAt.toISOString().slice(0, 7);
-      monthMap[monthKey] = (monthMap[monthKey] || 0) + inv.amountPaid;
+      monthMap[monthKey] = (monthMap[monthKey] || 0) + paid;
     }
   });
 
@@ -8,6 +8,7 @@ import { z } from 'zod';
 import { FinancingStatus } from '@prisma/client';
 import { authenticate } from '../middleware/auth';
 import { validateBody, validateQuery, paginationSchema } from '../middleware/validation';
+import { cacheControl } from '../middleware/cacheControl';
 import { asyncHandler } from '../middleware/errorHandler';
 import prisma from '../lib/prisma';
 
@@ -38,14 +39,18 @@ router.get('/', validateQuery(offersQuerySchema), asyncHandler(async (req, res)
   const { page = 1, pageSize = 20, status, leadId, projectId } = req.query as any;
 
   // Get leads/projects owned by user to filter financing
-  const userLeads = await prisma.lead.findMany({
-    where: { userId: req.user!.userId },
-    select: { id: true },
-  });
-  const userProjects = await prisma.project.findMany({
-    where: { userId: req.user!.userId },
-    select: { id: true },
-  });
+  // (FinancingOffer has no relation fields, so ownership is resolved via ID
+  // lists - fetch both in one parallel round trip)
+  const [userLeads, userProjects] = await Promise.all([
+    prisma.lead.findMany({
+      where: { userId: req.user!.userId },
+      select: { id: true },
+    }),
+    prisma.project.findMany({
+      where: { userId: req.user!.userId },
+      select: { id: true },
+    }),
+  ]);
 
   const leadIds = userLeads.map(l => l.id);
   const projectIds = userProjects.map(p => p.id);
@@ -82,15 +87,17 @@ router.get('/', validateQuery(offersQuerySchema), asyncHandler(async (req, res)
 }));
 
 // GET /api/financing/stats
-router.get('/stats', asyncHandler(async (req, res) => {
-  const userLeads = await prisma.lead.findMany({
-    where: { userId: req.user!.userId },
-    select: { id: true },
-  });
-  const userProjects = await prisma.project.findMany({
-    where: { userId: req.user!.userId },
-    select: { id: true },
-  });
+router.get('/stats', cacheControl(30), asyncHandler(async (req, res) => {
+  const [userLeads, userProjects] = await Promise.all([
+    prisma.lead.findMany({
+      where: { userId: req.user!.userId },
+      select: { id: true },
+    }),
+    prisma.project.findMany({
+      where: { userId: req.user!.userId },
+      select: { id: true },
+    }),
+  ]);
 
   const leadIds = userLeads.map(l => l.id);
   const projectIds = userProjects.map(p => p.id);
@@ -167,9 +174,18 @@ router.post('/', validateBody(createOfferSchema), asyncHandler(async (req, res)
     }
   }
 
+  const { leadId, projectId, lenderName, lenderLogo, amount, interestRate, termMonths, monthlyPayment } = req.body;
+
   const offer = await prisma.financingOffer.create({
     data: {
-      ...req.body,
+      leadId,
+      projectId,
+      lenderName,
+      lenderLogo,
+      amount,
+      interestRate,
+      termMonths,
+      monthlyPayment,
       status: 'OFFERED',
       commissionRate: 0.02, // 2% default
     },
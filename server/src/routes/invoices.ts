@@ -8,6 +8,7 @@ import { z } from 'zod';
 import { InvoiceStatus, PaymentMethod } from '@prisma/client';
 import { authenticate } from '../middleware/auth';
 import { validateBody, validateQuery, paginationSchema } from '../middleware/validation';
+import { cacheControl } from '../middleware/cacheControl';
 import { asyncHandler } from '../middleware/errorHandler';
 import { invoiceService } from '../services/invoices/InvoiceService';
 
@@ -52,6 +53,10 @@ const recordPaymentSchema = z.object({
   notes: z.string().optional(),
 });
 
+const revenueQuerySchema = z.object({
+  months: z.coerce.number().int().min(1).max(36).default(12),
+});
+
 // GET /api/invoices
 router.get('/', validateQuery(invoicesQuerySchema), asyncHandler(async (req, res) => {
   const result = await invoiceService.getInvoices(req.user!.userId, req.query as any);
@@ -66,7 +71,7 @@ router.get('/', validateQuery(invoicesQuerySchema), asyncHandler(async (req, res
 }));
 
 // GET /api/invoices/stats
-router.get('/stats', asyncHandler(async (req, res) => {
+router.get('/stats', cacheControl(30), asyncHandler(async (req, res) => {
   const stats = await invoiceService.getInvoiceStats(req.user!.userId);
   res.json({ success: true, data: stats });
 }));
@@ -78,8 +83,8 @@ router.get('/overdue', asyncHandler(async (req, res) => {
 }));
 
 // GET /api/invoices/revenue
-router.get('/revenue', asyncHandler(async (req, res) => {
-  const months = parseInt(req.query.months as string) || 12;
+router.get('/revenue', validateQuery(revenueQuerySchema), asyncHandler(async (req, res) => {
+  const { months } = req.query as any;
   const revenue = await invoiceService.getMonthlyRevenue(req.user!.userId, months);
   res.json({ success: true, data: revenue });
 }));
@@ -209,7 +209,17 @@ router.post(
     const job = await prisma.jobPosting.create({
       data: {
         userId: req.user!.userId,
-        ...data,
+        title: data.title,
+        description: data.description,
+        tradesNeeded: data.tradesNeeded,
+        city: data.city,
+        state: data.state,
+        zipCode: data.zipCode,
+        budgetMin: data.budgetMin,
+        budgetMax: data.budgetMax,
+        rateType: data.rateType,
+        urgency: data.urgency,
+        projectId: data.projectId,
         startDate: data.startDate ? new Date(data.startDate) : null,
         endDate: data.endDate ? new Date(data.endDate) : null,
         expiresAt: new Date(Date.now() + 30 * 24 * 60 * 60 * 1000), // 30 days
@@ -307,10 +317,15 @@ router.post(
     const { id } = req.params;
     const data = req.body;
 
-    // Check if user is a subcontractor
-    const subcontractor = await prisma.subcontractor.findFirst({
-      where: { userId: req.user!.userId },
-    });
+    // The subcontractor and job lookups are independent - run them together
+    const [subcontractor, job] = await Promise.all([
+      prisma.subcontractor.findFirst({
+        where: { userId: req.user!.userId },
+      }),
+      prisma.jobPosting.findFirst({
+        where: { id, status: 'OPEN' },
+      }),
+    ]);
 
     if (!subcontractor) {
       res.status(403).json({
@@ -320,11 +335,6 @@ router.post(
       return;
     }
 
-    // Check if job exists and is open
-    const job = await prisma.jobPosting.findFirst({
-      where: { id, status: 'OPEN' },
-    });
-
     if (!job) {
       res.status(404).json({
         success: false,
@@ -355,7 +365,10 @@ router.post(
       data: {
         jobPostingId: id,
         subcontractorId: subcontractor.id,
-        ...data,
+        coverLetter: data.coverLetter,
+        proposedRate: data.proposedRate,
+        estimatedDays: data.estimatedDays,
+        availability: data.availability,
       },
     });
 
@@ -435,7 +448,7 @@ router.patch(
       return;
     }
 
-    const updated = await prisma.jobApplication.update({
+    const updateApplication = prisma.jobApplication.update({
       where: { id },
       data: { status },
       include: {
@@ -450,25 +463,30 @@ router.patch(
       },
     });
 
-    // If accepted, create a SubcontractorHire record
+    let updated;
     if (status === 'ACCEPTED') {
-      await prisma.subcontractorHire.create({
-        data: {
-          subcontractorId: application.subcontractorId,
-          contractorId: req.user!.userId,
-          projectId: application.jobPosting.projectId,
-          description: application.jobPosting.title,
-          agreedRate: application.proposedRate || 0,
-          rateType: application.jobPosting.rateType,
-          status: 'ACCEPTED',
-        },
-      });
-
-      // Update job posting status to FILLED
-      await prisma.jobPosting.update({
-        where: { id: application.jobPostingId },
-        data: { status: 'FILLED' },
-      });
+      // Accepting touches three records - batch them in one transaction so
+      // the hire and posting update land atomically with the status change
+      [updated] = await prisma.$transaction([
+        updateApplication,
+        prisma.subcontractorHire.create({
+          data: {
+            subcontractorId: application.subcontractorId,
+            contractorId: req.user!.userId,
+            projectId: application.jobPosting.projectId,
+            description: application.jobPosting.title,
+            agreedRate: application.proposedRate || 0,
+            rateType: application.jobPosting.rateType,
+            status: 'ACCEPTED',
+          },
+        }),
+        prisma.jobPosting.update({
+          where: { id: application.jobPostingId },
+          data: { status: 'FILLED' },
+        }),
+      ]);
+    } else {
+      updated = await updateApplication;
     }
 
     res.json({
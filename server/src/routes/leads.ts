@@ -125,18 +125,14 @@ router.get(
       prisma.lead.count({ where }),
     ]);
 
-    const response = {
+    res.json({
       success: true,
       data: leads,
       total,
       page,
       pageSize,
       totalPages: Math.ceil(total / pageSize),
-    };
-    // #region agent log
-    fetch('http://127.0.0.1:7242/ingest/3c1497ab-660f-4a32-bc9b-5ee471fe0624',{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify({location:'routes/leads.ts:128',message:'GET /api/leads - response structure',data:{hasSuccess:!!response.success,hasData:!!response.data,dataIsArray:Array.isArray(response.data),dataLength:response.data?.length||0,hasTotal:typeof response.total==='number',hasPage:typeof response.page==='number',hasPageSize:typeof response.pageSize==='number',hasTotalPages:typeof response.totalPages==='number'},timestamp:Date.now(),sessionId:'api-contract-test',runId:'test-1',hypothesisId:'C'})}).catch(()=>{});
-    // #endregion
-    res.json(response);
+    });
   })
 );
 
@@ -601,28 +597,28 @@ router.post(
       return;
     }
 
-    // Create project from lead
-    const project = await prisma.project.create({
-      data: {
-        userId: req.user!.userId,
-        leadId: lead.id,
-        name: title,
-        description: description || `Renovation project at ${lead.street}, ${lead.city}`,
-        street: lead.street,
-        city: lead.city,
-        state: lead.state,
-        zipCode: lead.zipCode,
-        status: 'PLANNING',
-        startDate: startDate ? new Date(startDate) : null,
-        estimatedBudget: budget || lead.profitPotential || 0,
-      },
-    });
-
-    // Update lead status
-    await prisma.lead.update({
-      where: { id },
-      data: { status: 'WON' },
-    });
+    // Create project from lead and mark it WON in a single transaction
+    const [project] = await prisma.$transaction([
+      prisma.project.create({
+        data: {
+          userId: req.user!.userId,
+          leadId: lead.id,
+          name: title,
+          description: description || `Renovation project at ${lead.street}, ${lead.city}`,
+          street: lead.street,
+          city: lead.city,
+          state: lead.state,
+          zipCode: lead.zipCode,
+          status: 'PLANNING',
+          startDate: startDate ? new Date(startDate) : null,
+          estimatedBudget: budget || lead.profitPotential || 0,
+        },
+      }),
+      prisma.lead.update({
+        where: { id },
+        data: { status: 'WON' },
+      }),
+    ]);
 
     res.status(201).json({
       success: true,
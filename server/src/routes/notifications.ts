@@ -3,7 +3,9 @@
  */
 
 import { Router } from 'express';
+import { z } from 'zod';
 import { authenticate } from '../middleware/auth';
+import { validateQuery, paginationSchema } from '../middleware/validation';
 import { asyncHandler } from '../middleware/errorHandler';
 import { notificationService } from '../services/notifications/NotificationService';
 
@@ -11,11 +13,15 @@ const router = Router();
 
 router.use(authenticate);
 
+const notificationsQuerySchema = paginationSchema.extend({
+  // z.coerce.boolean() treats any non-empty string (including "false") as
+  // true, so coerce the query flag explicitly
+  unreadOnly: z.enum(['true', 'false']).default('false').transform((v) => v === 'true'),
+});
+
 // GET /api/notifications
-router.get('/', asyncHandler(async (req, res) => {
-  const unreadOnly = req.query.unreadOnly === 'true';
-  const page = parseInt(req.query.page as string) || 1;
-  const pageSize = parseInt(req.query.pageSize as string) || 20;
+router.get('/', validateQuery(notificationsQuerySchema), asyncHandler(async (req, res) => {
+  const { unreadOnly, page, pageSize } = req.query as any;
 
   const result = await notificationService.getNotifications(req.user!.userId, {
     unreadOnly,
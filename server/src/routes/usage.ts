@@ -4,19 +4,25 @@
  */
 
 import { Router } from 'express';
+import { z } from 'zod';
 import { authenticate } from '../middleware/auth';
+import { validateQuery } from '../middleware/validation';
+import { cacheControl } from '../middleware/cacheControl';
 import { asyncHandler } from '../middleware/errorHandler';
-import { UsageTrackingService } from '../services/usage/UsageTrackingService';
+import { usageTrackingService as usageService } from '../services/usage/UsageTrackingService';
 import { ProjectProfitabilityService } from '../services/analytics/ProjectProfitabilityService';
 import prisma from '../lib/prisma';
 
 const router = Router();
-const usageService = new UsageTrackingService();
 const profitabilityService = new ProjectProfitabilityService();
 
 // All routes require authentication
 router.use(authenticate);
 
+const historyQuerySchema = z.object({
+  days: z.coerce.number().int().min(1).max(365).default(30),
+});
+
 /**
  * GET /api/usage/current
  * Get current month's usage for the authenticated user
@@ -69,9 +75,9 @@ router.get('/current', asyncHandler(async (req, res) => {
  * GET /api/usage/history
  * Get usage history for charts
  */
-router.get('/history', asyncHandler(async (req, res) => {
+router.get('/history', validateQuery(historyQuerySchema), asyncHandler(async (req, res) => {
   const userId = req.user!.userId;
-  const days = parseInt(req.query.days as string) || 30;
+  const { days } = req.query as any;
 
   const startDate = new Date();
   startDate.setDate(startDate.getDate() - days);
@@ -95,7 +101,7 @@ router.get('/history', asyncHandler(async (req, res) => {
  * GET /api/usage/pricing-tiers
  * Get all pricing tiers and their features
  */
-router.get('/pricing-tiers', asyncHandler(async (req, res) => {
+router.get('/pricing-tiers', cacheControl(3600), asyncHandler(async (req, res) => {
   const tiers = usageService.getPricingTiers();
   
   res.json({
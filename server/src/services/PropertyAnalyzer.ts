@@ -5,7 +5,8 @@
 
 import { TavilyProvider } from './search/TavilyProvider';
 import { GeminiProvider, GeminiAnalysisOutput } from './ai/GeminiProvider';
-import { CacheService } from './cache/CacheService';
+import { CacheService, cacheService } from './cache/CacheService';
+import { logger } from '../utils/logger';
 import { v4 as uuidv4 } from 'uuid';
 
 // Types
@@ -73,6 +74,35 @@ interface ParsedAddress {
   fullAddress: string;
 }
 
+// Compiled once - these are consulted on every analysis request
+// Common US address pattern: "123 Main St, City, ST 12345"
+const ADDRESS_PATTERNS = [
+  // Pattern: Street, City, State ZIP
+  /^(.+?),\s*([^,]+),\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)?$/i,
+  // Pattern: Street, City State ZIP
+  /^(.+?),\s*([^,]+)\s+([A-Z]{2})\s*(\d{5}(?:-\d{4})?)?$/i,
+  // Pattern: Street City, State ZIP
+  /^(.+?)\s+([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)?$/i,
+];
+
+// Failed analyses are cached much shorter than successful ones - long
+// enough to absorb a retry storm, short enough to recover quickly
+const ERROR_CACHE_TTL_SECONDS = 60;
+
+// Domain lists for source categorization
+const LISTING_DOMAINS = ['zillow.com', 'redfin.com', 'realtor.com', 'trulia.com'];
+const NEIGHBORHOOD_DOMAINS = ['walkscore.com', 'greatschools.org', 'niche.com', 'areavibes.com'];
+const MARKET_DOMAINS = ['nar.realtor', 'noradarealestate.com'];
+
+// Memoized categorization results: the same handful of source domains
+// recur across every search result and every analysis, so the substring
+// scans above only run once per distinct domain. Bounded like an
+// lru_cache so unexpected input can't grow it without limit.
+type SourceCategory = 'listing' | 'valuation' | 'market' | 'neighborhood' | 'general';
+
+const SOURCE_CATEGORY_CACHE = new Map<string, SourceCategory>();
+const SOURCE_CATEGORY_CACHE_MAX = 1024;
+
 export class PropertyAnalyzerService {
   private searchProvider: TavilyProvider;
   private aiProvider: GeminiProvider;
@@ -85,7 +115,13 @@ export class PropertyAnalyzerService {
   ) {
     this.searchProvider = new TavilyProvider(tavilyApiKey);
     this.aiProvider = new GeminiProvider(geminiApiKey);
-    this.cache = new CacheService(cacheOptions?.ttlMinutes);
+    // Use the shared configured cache (TTL, size and the optional snapshot
+    // file all come from config) unless the caller overrides the TTL - the
+    // reliability audit does this to disable caching entirely
+    this.cache =
+      cacheOptions?.ttlMinutes !== undefined
+        ? new CacheService(cacheOptions.ttlMinutes)
+        : cacheService;
   }
 
   /**
@@ -93,7 +129,7 @@ export class PropertyAnalyzerService {
    */
   async analyzeProperty(request: AnalyzePropertyRequest): Promise<PropertyAnalysis> {
     const startTime = Date.now();
-    console.log(`🏠 Starting analysis for: ${request.address}`);
+    logger.info(`🏠 Starting analysis for: ${request.address}`);
 
     // Parse the address
     const parsedAddress = this.parseAddress(request);
@@ -103,14 +139,14 @@ export class PropertyAnalyzerService {
     if (!request.skipCache) {
       const cached = this.cache.get<PropertyAnalysis>(cacheKey);
       if (cached) {
-        console.log(`✅ Cache hit for: ${parsedAddress.fullAddress}`);
+        logger.debug(`✅ Cache hit for: ${parsedAddress.fullAddress}`);
         return { ...cached, cached: true };
       }
     }
 
     try {
       // Step 1: Perform comprehensive web search
-      console.log('🔍 Searching for property data...');
+      logger.debug('🔍 Searching for property data...');
       const searchData = await this.searchProvider.comprehensivePropertySearch(
         parsedAddress.fullAddress,
         parsedAddress.city,
@@ -118,7 +154,7 @@ export class PropertyAnalyzerService {
       );
 
       // Step 2: Analyze with AI
-      console.log('🤖 Analyzing with AI...');
+      logger.debug('🤖 Analyzing with AI...');
       const aiAnalysis = await this.aiProvider.analyzeProperty({
         address: parsedAddress.street,
         city: parsedAddress.city,
@@ -139,14 +175,18 @@ export class PropertyAnalyzerService {
       this.cache.set(cacheKey, analysis);
 
       const duration = Date.now() - startTime;
-      console.log(`✅ Analysis complete in ${duration}ms`);
+      logger.info(`✅ Analysis complete in ${duration}ms`);
 
       return analysis;
     } catch (error) {
-      console.error('❌ Property analysis failed:', error);
-      
-      // Return a partial result with error indication
-      return this.buildErrorResult(parsedAddress, error as Error);
+      logger.error('❌ Property analysis failed:', error);
+
+      // Build a partial result with error indication and cache it briefly:
+      // a failing address (bad data, provider outage, rate limit) would
+      // otherwise re-trigger the full search + AI pipeline on every retry
+      const errorResult = this.buildErrorResult(parsedAddress, error as Error);
+      this.cache.set(cacheKey, errorResult, ERROR_CACHE_TTL_SECONDS);
+      return errorResult;
     }
   }
 
@@ -183,17 +223,7 @@ export class PropertyAnalyzerService {
   private parseFullAddress(address: string): Partial<ParsedAddress> {
     const result: Partial<ParsedAddress> = {};
 
-    // Common US address pattern: "123 Main St, City, ST 12345"
-    const patterns = [
-      // Pattern: Street, City, State ZIP
-      /^(.+?),\s*([^,]+),\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)?$/i,
-      // Pattern: Street, City State ZIP
-      /^(.+?),\s*([^,]+)\s+([A-Z]{2})\s*(\d{5}(?:-\d{4})?)?$/i,
-      // Pattern: Street City, State ZIP
-      /^(.+?)\s+([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)?$/i,
-    ];
-
-    for (const pattern of patterns) {
+    for (const pattern of ADDRESS_PATTERNS) {
       const match = address.match(pattern);
       if (match) {
         result.street = match[1]?.trim();
@@ -222,11 +252,15 @@ export class PropertyAnalyzerService {
     searchResults: SearchResult[],
     userId?: string
   ): PropertyAnalysis {
+    // Capture one timestamp for the whole result instead of allocating a
+    // Date per source - they all describe the same analysis run anyway
+    const now = new Date();
+
     const sources: DataSource[] = searchResults.map((r) => ({
       name: r.source,
       url: r.url,
       dataType: this.categorizeSource(r.source),
-      retrievedAt: new Date(),
+      retrievedAt: now,
     }));
 
     return {
@@ -277,7 +311,7 @@ export class PropertyAnalyzerService {
       recommendations: aiAnalysis.recommendations,
       aiSummary: aiAnalysis.summary,
       sources,
-      analyzedAt: new Date(),
+      analyzedAt: now,
       cached: false,
     };
   }
@@ -330,20 +364,25 @@ export class PropertyAnalyzerService {
   /**
    * Categorize a source by its domain
    */
-  private categorizeSource(source: string): 'listing' | 'valuation' | 'market' | 'neighborhood' | 'general' {
+  private categorizeSource(source: string): SourceCategory {
     const domain = source.toLowerCase();
-    
-    if (['zillow.com', 'redfin.com', 'realtor.com', 'trulia.com'].some(d => domain.includes(d))) {
-      return 'listing';
-    }
-    if (['walkscore.com', 'greatschools.org', 'niche.com', 'areavibes.com'].some(d => domain.includes(d))) {
-      return 'neighborhood';
+
+    const cached = SOURCE_CATEGORY_CACHE.get(domain);
+    if (cached) return cached;
+
+    let category: SourceCategory = 'general';
+    if (LISTING_DOMAINS.some(d => domain.includes(d))) {
+      category = 'listing';
+    } else if (NEIGHBORHOOD_DOMAINS.some(d => domain.includes(d))) {
+      category = 'neighborhood';
+    } else if (MARKET_DOMAINS.some(d => domain.includes(d))) {
+      category = 'market';
     }
-    if (['nar.realtor', 'noradarealestate.com'].some(d => domain.includes(d))) {
-      return 'market';
+
+    if (SOURCE_CATEGORY_CACHE.size < SOURCE_CATEGORY_CACHE_MAX) {
+      SOURCE_CATEGORY_CACHE.set(domain, category);
     }
-    
-    return 'general';
+    return category;
   }
 
   /**
@@ -3,7 +3,9 @@
  * Uses Google Gemini for analyzing property data and generating insights
  */
 
-import { GoogleGenerativeAI, GenerativeModel } from '@google/generative-ai';
+// Type-only import: the SDK itself is loaded lazily on first use so cold
+// starts (health checks, routes that never touch AI) don't pay for it
+import type { GoogleGenerativeAI, GenerativeModel } from '@google/generative-ai';
 
 // Types
 export interface PropertyScores {
@@ -77,84 +79,11 @@ export interface GeminiAnalysisOutput {
   summary: string;
 }
 
-export class GeminiProvider {
-  private genAI: GoogleGenerativeAI | null = null;
-  private model: GenerativeModel | null = null;
-  private modelName: string;
+// Static prompt sections, built once at module load. buildAnalysisPrompt only
+// interpolates the per-request address and search context between them.
+const ANALYSIS_PROMPT_INTRO = `You are a Lead Intelligence Analyst for RENOVATION CONTRACTORS. Your job is to analyze property data and provide actionable business intelligence that helps contractors identify renovation opportunities and qualify leads.`;
 
-  constructor(apiKey?: string, modelName: string = 'gemini-2.0-flash') {
-    const key = apiKey || process.env.GEMINI_API_KEY;
-    this.modelName = modelName;
-
-    if (key) {
-      this.genAI = new GoogleGenerativeAI(key);
-      // Configure model for deterministic output
-      this.model = this.genAI.getGenerativeModel({
-        model: modelName,
-        generationConfig: {
-          temperature: 0,  // Deterministic responses
-          topP: 1,
-          topK: 1,
-          maxOutputTokens: 8192,
-        },
-      });
-    } else {
-      console.warn('⚠️ Gemini API key not configured');
-    }
-  }
-
-  /**
-   * Analyze property data and generate insights
-   */
-  async analyzeProperty(input: PropertyAnalysisInput): Promise<GeminiAnalysisOutput> {
-    if (!this.model) {
-      throw new Error('Gemini API key not configured');
-    }
-
-    const prompt = this.buildAnalysisPrompt(input);
-
-    try {
-      // Add timeout wrapper (60 seconds for AI analysis)
-      const timeoutPromise = new Promise<never>((_, reject) => {
-        setTimeout(() => reject(new Error('Gemini API request timed out after 60 seconds')), 60000);
-      });
-      
-      const result = await Promise.race([
-        this.model.generateContent(prompt),
-        timeoutPromise,
-      ]);
-      
-      const response = result.response;
-      const text = response.text();
-
-      return this.parseAnalysisResponse(text);
-    } catch (error) {
-      console.error('Gemini analysis failed:', error);
-      if (error instanceof Error && error.message.includes('timed out')) {
-        throw new Error('AI analysis timed out. Please try again.');
-      }
-      throw error;
-    }
-  }
-
-  /**
-   * Build the analysis prompt
-   */
-  private buildAnalysisPrompt(input: PropertyAnalysisInput): string {
-    const searchContext = input.searchResults
-      .map((r, i) => `[Source ${i + 1}: ${r.source}]\n${r.content}`)
-      .join('\n\n---\n\n');
-
-    return `You are a Lead Intelligence Analyst for RENOVATION CONTRACTORS. Your job is to analyze property data and provide actionable business intelligence that helps contractors identify renovation opportunities and qualify leads.
-
-PROPERTY ADDRESS:
-${input.address}
-${input.city}, ${input.state} ${input.zipCode}
-
-SEARCH DATA:
-${searchContext}
-
-**CRITICAL INSTRUCTIONS:**
+const ANALYSIS_PROMPT_INSTRUCTIONS = `**CRITICAL INSTRUCTIONS:**
 
 1. **DATA QUALITY MATTERS**: Penalize scores when data is missing or low-quality:
    - Missing basic property details (sqft, beds, baths, year) = reduce scores by 10-20 points
@@ -266,6 +195,102 @@ SCORING GUIDELINES FOR CONTRACTORS (STRICT):
 - Profit Potential: Base score 40-60, +15 for high equity, +10 for renovation need, -20 if no valuation
 - Overall: Weighted average (30% lead quality, 25% renovation, 25% motivation, 20% profit) adjusted for data quality
 - Avoid generic scores like exactly 50 - use evidence-based values; only use 50 if truly justified by balanced evidence`;
+
+export class GeminiProvider {
+  private genAI: GoogleGenerativeAI | null = null;
+  private model: GenerativeModel | null = null;
+  private modelName: string;
+  private apiKey: string | null;
+
+  constructor(apiKey?: string, modelName: string = 'gemini-2.0-flash') {
+    this.apiKey = apiKey || process.env.GEMINI_API_KEY || null;
+    this.modelName = modelName;
+
+    if (!this.apiKey) {
+      console.warn('⚠️ Gemini API key not configured');
+    }
+  }
+
+  /**
+   * Load the SDK and build the model on first use
+   */
+  private getModel(): GenerativeModel {
+    if (this.model) {
+      return this.model;
+    }
+
+    if (!this.apiKey) {
+      throw new Error('Gemini API key not configured');
+    }
+
+    const { GoogleGenerativeAI: GenAI } =
+      require('@google/generative-ai') as typeof import('@google/generative-ai');
+
+    this.genAI = new GenAI(this.apiKey);
+    // Configure model for deterministic output
+    this.model = this.genAI.getGenerativeModel({
+      model: this.modelName,
+      generationConfig: {
+        temperature: 0,  // Deterministic responses
+        topP: 1,
+        topK: 1,
+        maxOutputTokens: 8192,
+      },
+    });
+
+    return this.model;
+  }
+
+  /**
+   * Analyze property data and generate insights
+   */
+  async analyzeProperty(input: PropertyAnalysisInput): Promise<GeminiAnalysisOutput> {
+    const model = this.getModel();
+
+    const prompt = this.buildAnalysisPrompt(input);
+
+    try {
+      // Add timeout wrapper (60 seconds for AI analysis)
+      const timeoutPromise = new Promise<never>((_, reject) => {
+        setTimeout(() => reject(new Error('Gemini API request timed out after 60 seconds')), 60000);
+      });
+      
+      const result = await Promise.race([
+        model.generateContent(prompt),
+        timeoutPromise,
+      ]);
+      
+      const response = result.response;
+      const text = response.text();
+
+      return this.parseAnalysisResponse(text);
+    } catch (error) {
+      console.error('Gemini analysis failed:', error);
+      if (error instanceof Error && error.message.includes('timed out')) {
+        throw new Error('AI analysis timed out. Please try again.');
+      }
+      throw error;
+    }
+  }
+
+  /**
+   * Build the analysis prompt
+   */
+  private buildAnalysisPrompt(input: PropertyAnalysisInput): string {
+    const searchContext = input.searchResults
+      .map((r, i) => `[Source ${i + 1}: ${r.source}]\n${r.content}`)
+      .join('\n\n---\n\n');
+
+    return `${ANALYSIS_PROMPT_INTRO}
+
+PROPERTY ADDRESS:
+${input.address}
+${input.city}, ${input.state} ${input.zipCode}
+
+SEARCH DATA:
+${searchContext}
+
+${ANALYSIS_PROMPT_INSTRUCTIONS}`;
   }
 
   /**
@@ -407,12 +432,10 @@ SCORING GUIDELINES FOR CONTRACTORS (STRICT):
    * Generate lead intelligence analysis
    */
   async generateLeadIntelligence(prompt: string): Promise<string> {
-    if (!this.model) {
-      throw new Error('Gemini model not initialized');
-    }
+    const model = this.getModel();
 
     try {
-      const result = await this.model.generateContent(prompt);
+      const result = await model.generateContent(prompt);
       const response = await result.response;
       return response.text();
     } catch (error) {
@@ -425,7 +448,7 @@ SCORING GUIDELINES FOR CONTRACTORS (STRICT):
    * Check if the provider is properly configured
    */
   isConfigured(): boolean {
-    return this.model !== null;
+    return this.apiKey !== null;
   }
 
   /**
@@ -22,29 +22,48 @@ interface ProjectProfitability {
 }
 
 export class ProjectProfitabilityService {
+  // Exactly the fields buildProfitability reads, precomputed once. A bare
+  // include hydrated every column of every related row; the math below only
+  // needs a handful of numeric fields per relation.
+  private static readonly PROFITABILITY_SELECT = {
+    id: true,
+    name: true,
+    status: true,
+    invoices: {
+      where: { status: 'PAID' as const },
+      select: { payments: { select: { amount: true } } },
+    },
+    materials: { select: { subtotal: true, tax: true } },
+    subcontractorHires: { select: { agreedRate: true } },
+  };
+
   /**
    * Calculate profitability for a single project
    */
   async calculateProjectProfitability(projectId: string): Promise<ProjectProfitability> {
     const project = await prisma.project.findUnique({
       where: { id: projectId },
-      include: {
-        invoices: {
-          where: { status: 'PAID' },
-          include: { payments: true },
-        },
-        materials: true,
-        subcontractorHires: true,
-        quotes: {
-          where: { status: 'ACCEPTED' },
-        },
-      },
+      select: ProjectProfitabilityService.PROFITABILITY_SELECT,
     });
 
     if (!project) {
       throw new Error('Project not found');
     }
 
+    return this.buildProfitability(project);
+  }
+
+  /**
+   * Compute the profitability numbers for an already-loaded project
+   */
+  private async buildProfitability(project: {
+    id: string;
+    name: string;
+    status: string;
+    invoices: { payments: { amount: number }[] }[];
+    materials: { subtotal: number; tax: number }[];
+    subcontractorHires: { agreedRate: number | null }[];
+  }): Promise<ProjectProfitability> {
     // Calculate revenue from paid invoices
     const revenue = project.invoices.reduce((sum, invoice) => {
       const paidAmount = invoice.payments.reduce((s, p) => s + p.amount, 0);
@@ -52,17 +71,17 @@ export class ProjectProfitabilityService {
     }, 0);
 
     // Calculate material costs
-    const materialCosts = project.materials.reduce((sum, order) => 
+    const materialCosts = project.materials.reduce((sum, order) =>
       sum + (order.subtotal + order.tax), 0
     );
 
     // Calculate subcontractor costs
-    const subcontractorCosts = project.subcontractorHires.reduce((sum, hire) => 
+    const subcontractorCosts = project.subcontractorHires.reduce((sum, hire) =>
       sum + (hire.agreedRate || 0), 0
     );
 
     // Calculate commissions (if any commissions are tied to this project)
-    const commissions = await this.calculateProjectCommissions(projectId);
+    const commissions = await this.calculateProjectCommissions(project.id);
 
     // Overhead (15% of revenue as industry standard)
     const overhead = revenue * 0.15;
@@ -135,13 +154,15 @@ export class ProjectProfitabilityService {
     topProjects: ProjectProfitability[];
     lossProjects: ProjectProfitability[];
   }> {
+    // One query with the relations included, instead of a findUnique per
+    // project - the dashboard used to fan out N queries for N projects
     const projects = await prisma.project.findMany({
       where: { userId },
-      select: { id: true },
+      select: ProjectProfitabilityService.PROFITABILITY_SELECT,
     });
 
     const profitabilities = await Promise.all(
-      projects.map(p => this.calculateProjectProfitability(p.id))
+      projects.map(p => this.buildProfitability(p))
     );
 
     const totalRevenue = profitabilities.reduce((sum, p) => sum + p.revenue, 0);
@@ -4,10 +4,14 @@
  */
 
 import NodeCache from 'node-cache';
+import fs from 'fs';
+import { logger } from '../../utils/logger';
 
+// Epoch millis rather than a Date keeps entries to one small flat object -
+// with thousands of keys resident the per-entry Date wrapper adds up
 export interface CacheEntry<T> {
   data: T;
-  cachedAt: Date;
+  cachedAt: number;
   hitCount: number;
 }
 
@@ -16,68 +20,163 @@ export class CacheService {
   private hits = 0;
   private misses = 0;
   private maxSize: number;
-
-  constructor(ttlMinutes: number = 60, maxSize: number = 1000) {
+  // Access-order tracking for LRU eviction: Set preserves insertion order,
+  // so the first entry is always the least recently used key
+  private lru = new Set<string>();
+  // Optional snapshot file: when set, the cache is restored from it on
+  // startup and written back (debounced) on mutation, so warm data
+  // survives process restarts. Cached values must be JSON-serializable.
+  private persistPath: string | null;
+  private saveTimer: NodeJS.Timeout | null = null;
+
+  constructor(ttlMinutes: number = 60, maxSize: number = 1000, persistPath: string | null = null) {
     this.cache = new NodeCache({
       stdTTL: ttlMinutes * 60, // Convert to seconds
       checkperiod: 120, // Check for expired keys every 2 minutes
-      useClones: true, // Return clones to prevent mutation
+      // No clones: cloning deep-copied every cached analysis on each get/set.
+      // Cached values are treated as immutable - callers must copy before mutating
+      useClones: false,
       maxKeys: maxSize, // Limit number of keys to prevent memory exhaustion
     });
     
     this.maxSize = maxSize;
+    this.persistPath = persistPath;
+
+    if (this.persistPath) {
+      this.loadSnapshot();
+    }
 
-    // Log cache events
+    // Log cache events and keep recency tracking in sync
     this.cache.on('expired', (key) => {
-      console.log(`🗑️ Cache expired: ${key}`);
+      this.lru.delete(key);
+      logger.debug(`🗑️ Cache expired: ${key}`);
+    });
+    this.cache.on('del', (key) => {
+      this.lru.delete(key);
     });
   }
 
+  /**
+   * Mark a key as most recently used
+   */
+  private markUsed(key: string): void {
+    this.lru.delete(key);
+    this.lru.add(key);
+  }
+
+  /**
+   * Restore entries from the snapshot file, skipping anything expired
+   */
+  private loadSnapshot(): void {
+    try {
+      if (!fs.existsSync(this.persistPath!)) return;
+
+      const records: { key: string; entry: CacheEntry<unknown>; expiresAt: number }[] =
+        JSON.parse(fs.readFileSync(this.persistPath!, 'utf-8'));
+
+      const now = Date.now();
+      let restored = 0;
+      for (const record of records) {
+        // expiresAt of 0 means the entry had no TTL; keep the default
+        if (record.expiresAt === 0) {
+          this.cache.set(record.key, record.entry);
+        } else if (record.expiresAt > now) {
+          this.cache.set(record.key, record.entry, Math.ceil((record.expiresAt - now) / 1000));
+        } else {
+          continue;
+        }
+        this.markUsed(record.key);
+        restored++;
+      }
+
+      if (restored > 0) {
+        logger.info(`💾 Restored ${restored} cache entries from ${this.persistPath}`);
+      }
+    } catch (error) {
+      logger.warn('⚠️ Could not restore cache snapshot:', (error as Error).message);
+    }
+  }
+
+  /**
+   * Write the snapshot at most once per debounce window
+   */
+  private scheduleSave(): void {
+    if (!this.persistPath || this.saveTimer) return;
+
+    this.saveTimer = setTimeout(() => {
+      this.saveTimer = null;
+      this.saveSnapshot();
+    }, 5000);
+    // Don't keep the process alive just to flush the cache
+    this.saveTimer.unref();
+  }
+
+  private saveSnapshot(): void {
+    try {
+      const records = this.cache.keys().map((key) => ({
+        key,
+        entry: this.cache.get<CacheEntry<unknown>>(key),
+        expiresAt: this.cache.getTtl(key) || 0,
+      })).filter((r) => r.entry !== undefined);
+
+      fs.writeFileSync(this.persistPath!, JSON.stringify(records));
+    } catch (error) {
+      logger.warn('⚠️ Could not write cache snapshot:', (error as Error).message);
+    }
+  }
+
   /**
    * Get an item from cache
+   * Returned values are shared, not cloned - treat them as immutable
    */
   get<T>(key: string): T | undefined {
     const entry = this.cache.get<CacheEntry<T>>(key);
-    
+
     if (entry) {
       this.hits++;
+      // With clones disabled the stored entry is shared, so the hit count
+      // can be bumped in place without a second set()
       entry.hitCount++;
-      this.cache.set(key, entry); // Update hit count
-      console.log(`📦 Cache hit: ${key} (hits: ${entry.hitCount})`);
+      this.markUsed(key);
+      // Per-get logging is hot-path; only emitted at LOG_LEVEL=debug
+      logger.debug(`📦 Cache hit: ${key} (hits: ${entry.hitCount})`);
       return entry.data;
     }
-    
+
     this.misses++;
     return undefined;
   }
 
   /**
    * Set an item in cache
-   * Implements simple eviction when cache is full
-   * Note: True LRU requires tracking access patterns, this is a simplified version
+   * Evicts the least-recently-used entry when the cache is full
    */
   set<T>(key: string, data: T, ttlSeconds?: number): boolean {
-    // If cache is at max size and key doesn't exist, evict oldest entry
-    if (!this.cache.has(key)) {
-      const keys = this.cache.keys(); // Call only once for efficiency
-      if (keys.length >= this.maxSize && keys.length > 0) {
-        // Evict first key (oldest entry)
-        this.cache.del(keys[0]);
-        console.log(`⚠️ Cache full, evicted: ${keys[0]}`);
+    // If cache is at max size and key doesn't exist, evict the LRU entry
+    if (!this.cache.has(key) && this.lru.size >= this.maxSize) {
+      const lruKey = this.lru.values().next().value;
+      if (lruKey !== undefined) {
+        this.cache.del(lruKey);
+        logger.debug(`⚠️ Cache full, evicted: ${lruKey}`);
       }
     }
-    
+
     const entry: CacheEntry<T> = {
       data,
-      cachedAt: new Date(),
+      cachedAt: Date.now(),
       hitCount: 0,
     };
 
-    if (ttlSeconds) {
-      return this.cache.set(key, entry, ttlSeconds);
+    const stored = ttlSeconds
+      ? this.cache.set(key, entry, ttlSeconds)
+      : this.cache.set(key, entry);
+
+    if (stored) {
+      this.markUsed(key);
+      this.scheduleSave();
     }
-    
-    return this.cache.set(key, entry);
+
+    return stored;
   }
 
   /**
@@ -92,6 +191,9 @@ export class CacheService {
    */
   delete(key: string): boolean {
     const deleted = this.cache.del(key);
+    if (deleted > 0) {
+      this.scheduleSave();
+    }
     return deleted > 0;
   }
 
@@ -100,9 +202,11 @@ export class CacheService {
    */
   clear(): void {
     this.cache.flushAll();
+    this.lru.clear();
     this.hits = 0;
     this.misses = 0;
-    console.log('🧹 Cache cleared');
+    this.scheduleSave();
+    logger.info('🧹 Cache cleared');
   }
 
   /**
@@ -145,5 +249,6 @@ import { config } from '../../config';
 
 export const cacheService = new CacheService(
   config.cache.ttlMinutes,
-  config.cache.maxSize
+  config.cache.maxSize,
+  config.cache.persistPath
 );
@@ -1,6 +1,7 @@
-import { TavilyProvider } from '../search/TavilyProvider';
-import { GeminiProvider } from '../ai/GeminiProvider';
-import { UsageTrackingService } from '../usage/UsageTrackingService';
+import { TavilyProvider, tavilyProvider } from '../search/TavilyProvider';
+import { GeminiProvider, geminiProvider } from '../ai/GeminiProvider';
+import { UsageTrackingService, usageTrackingService } from '../usage/UsageTrackingService';
+import { logger } from '../../utils/logger';
 
 export interface LeadIntelligence {
   leadScore: number;
@@ -124,19 +125,135 @@ export interface SalesApproach {
   followUpCadence: string;
 }
 
+// Static sections of the lead-intelligence prompt, assembled once at
+// module load; only the address and search context vary per call
+const LEAD_INTEL_PROMPT_INTRO = `You are a lead intelligence analyst for a renovation contractor CRM. Analyze the following search results about a property and generate comprehensive lead intelligence.`;
+
+const LEAD_INTEL_PROMPT_INSTRUCTIONS = `**CRITICAL ANALYSIS REQUIREMENTS:**
+
+1. **PERMIT HISTORY ANALYSIS**: Carefully review all permits found. Recent permits indicate:
+   - Active property improvement (HIGH motivation)
+   - Budget availability for contractors
+   - Incomplete projects may need finishing
+   - Pattern of permits = renovation-focused owner
+   
+2. **EQUITY EXTRACTION**: Calculate potential free equity:
+   - Estimated Value - Mortgage Balance - Liens = Available Equity
+   - High equity (>40%) = financing opportunity
+   - Low equity (<20%) = may need creative financing
+   - Include equity in financial intel and sales approach
+   
+3. **HOME BUSINESS DETECTION**: Look for business records at property address:
+   - LLC/Business registered at property = home office
+   - Extract business type, industry, occupation
+   - Estimate business income potential
+   - Home businesses often need office renovations, accessibility improvements
+   - Professional spaces (medical, legal, consulting) have specific renovation needs
+
+Based on this information, provide a detailed JSON analysis. Be realistic - if data is not found, use null or reasonable estimates based on available information. Focus on actionable intelligence for a renovation contractor.
+
+Return ONLY valid JSON matching this structure:
+{
+  "leadScore": <0-100 score for lead quality>,
+  "renovationPotential": "<LOW|MEDIUM|HIGH|EXCELLENT>",
+  "ownerMotivation": "<LOW|MEDIUM|HIGH|VERY_HIGH>",
+  "profitPotential": <estimated profit in dollars>,
+  
+  "propertyIntel": {
+    "yearBuilt": <number or null>,
+    "squareFeet": <number or null>,
+    "bedrooms": <number or null>,
+    "bathrooms": <number or null>,
+    "lotSize": "<string or null>",
+    "lastSaleDate": "<string or null>",
+    "lastSalePrice": <number or null>,
+    "estimatedValue": <number or null>,
+    "propertyType": "<string or null>",
+    "condition": "<string describing condition or null>",
+    "taxAssessedValue": <number or null>,
+    "hoaFees": <number or null>,
+    "zoning": "<string or null>",
+    "floodZone": <boolean or null>,
+    "recentRenovations": ["<list of recent renovations if known>"],
+    "knownIssues": ["<list of known property issues>"]
+  },
+  
+  "ownerIntel": {
+    "ownerName": "<string or null>",
+    "ownerType": "<INDIVIDUAL|LLC|TRUST|BANK|UNKNOWN>",
+    "ownerSince": "<date string or null>",
+    "mailingAddress": "<string or null>",
+    "phoneNumbers": ["<list of phone numbers if found>"],
+    "emailAddresses": ["<list of emails if found>"],
+    "businessRecords": [{"businessName": "", "status": "", "type": "", "registrationDate": null}],
+    "estimatedIncome": "<string estimate or null>",
+    "likelyToSell": <boolean or null>,
+    "motivationFactors": ["<factors that might motivate renovation or sale>"]
+  },
+  
+  "financialIntel": {
+    "estimatedEquity": <number or null>,
+    "mortgageBalance": <number or null>,
+    "lienAmount": <total lien amount or null>,
+    "liens": [{"type": "", "amount": 0, "creditor": "", "filedDate": "", "status": ""}],
+    "taxDelinquent": <boolean>,
+    "taxOwed": <number or null>,
+    "foreclosureStatus": "<string or null>",
+    "bankruptcyHistory": <boolean or null>,
+    "financingLikelihood": "<LOW|MEDIUM|HIGH>"
+  },
+  
+  "permitHistory": {
+    "totalPermits": <number>,
+    "recentPermits": [{"type": "", "description": "", "issueDate": "", "status": "", "estimatedCost": null, "contractor": null}],
+    "activePermits": <number>,
+    "lastPermitDate": "<string or null>",
+    "permitTypes": ["<list of permit types seen>"],
+    "codeViolations": [{"type": "", "description": "", "date": "", "status": "", "fineAmount": null}]
+  },
+  
+  "renovationOpps": [
+    {
+      "area": "<Kitchen|Bathroom|Roof|HVAC|Windows|Flooring|Exterior|Landscaping|etc>",
+      "description": "<specific opportunity description>",
+      "estimatedCost": {"min": 0, "max": 0},
+      "estimatedValueAdd": {"min": 0, "max": 0},
+      "roi": <percentage as number>,
+      "priority": "<LOW|MEDIUM|HIGH|CRITICAL>",
+      "timelineWeeks": {"min": 0, "max": 0},
+      "complexity": "<SIMPLE|MODERATE|COMPLEX>",
+      "permits_required": <boolean>
+    }
+  ],
+  
+  "salesApproach": {
+    "recommendedApproach": "<strategic approach for this lead>",
+    "keyTalkingPoints": ["<key points to mention>"],
+    "painPoints": ["<likely owner pain points>"],
+    "objectionHandlers": [{"objection": "<common objection>", "response": "<recommended response>"}],
+    "bestContactTime": "<recommendation or null>",
+    "preferredContactMethod": "<PHONE|EMAIL|TEXT|IN_PERSON|UNKNOWN>",
+    "urgencyLevel": "<LOW|MEDIUM|HIGH|IMMEDIATE>",
+    "followUpCadence": "<recommended follow-up schedule>"
+  }
+}`;
+
 export class LeadIntelligenceService {
   private searchProvider: TavilyProvider;
   private aiProvider: GeminiProvider;
   private usageService: UsageTrackingService;
 
   constructor() {
-    this.searchProvider = new TavilyProvider();
-    this.aiProvider = new GeminiProvider();
-    this.usageService = new UsageTrackingService();
+    // Reuse the shared provider singletons rather than constructing private
+    // copies - the providers hold per-instance state (lazy SDK clients) that
+    // should be built once per process
+    this.searchProvider = tavilyProvider;
+    this.aiProvider = geminiProvider;
+    this.usageService = usageTrackingService;
   }
 
   async generateLeadIntelligence(address: string, userId?: string, leadId?: string): Promise<LeadIntelligence> {
-    console.log(`Generating lead intelligence for: ${address}`);
+    logger.info(`Generating lead intelligence for: ${address}`);
     
     // Parallel searches for different intel categories
     const [
@@ -275,121 +392,7 @@ ${businessSearch}
   }
 
   private async analyzeWithAI(address: string, context: string): Promise<LeadIntelligence> {
-    const prompt = `You are a lead intelligence analyst for a renovation contractor CRM. Analyze the following search results about a property and generate comprehensive lead intelligence.
-
-Address: ${address}
-
-Search Results:
-${context}
-
-**CRITICAL ANALYSIS REQUIREMENTS:**
-
-1. **PERMIT HISTORY ANALYSIS**: Carefully review all permits found. Recent permits indicate:
-   - Active property improvement (HIGH motivation)
-   - Budget availability for contractors
-   - Incomplete projects may need finishing
-   - Pattern of permits = renovation-focused owner
-   
-2. **EQUITY EXTRACTION**: Calculate potential free equity:
-   - Estimated Value - Mortgage Balance - Liens = Available Equity
-   - High equity (>40%) = financing opportunity
-   - Low equity (<20%) = may need creative financing
-   - Include equity in financial intel and sales approach
-   
-3. **HOME BUSINESS DETECTION**: Look for business records at property address:
-   - LLC/Business registered at property = home office
-   - Extract business type, industry, occupation
-   - Estimate business income potential
-   - Home businesses often need office renovations, accessibility improvements
-   - Professional spaces (medical, legal, consulting) have specific renovation needs
-
-Based on this information, provide a detailed JSON analysis. Be realistic - if data is not found, use null or reasonable estimates based on available information. Focus on actionable intelligence for a renovation contractor.
-
-Return ONLY valid JSON matching this structure:
-{
-  "leadScore": <0-100 score for lead quality>,
-  "renovationPotential": "<LOW|MEDIUM|HIGH|EXCELLENT>",
-  "ownerMotivation": "<LOW|MEDIUM|HIGH|VERY_HIGH>",
-  "profitPotential": <estimated profit in dollars>,
-  
-  "propertyIntel": {
-    "yearBuilt": <number or null>,
-    "squareFeet": <number or null>,
-    "bedrooms": <number or null>,
-    "bathrooms": <number or null>,
-    "lotSize": "<string or null>",
-    "lastSaleDate": "<string or null>",
-    "lastSalePrice": <number or null>,
-    "estimatedValue": <number or null>,
-    "propertyType": "<string or null>",
-    "condition": "<string describing condition or null>",
-    "taxAssessedValue": <number or null>,
-    "hoaFees": <number or null>,
-    "zoning": "<string or null>",
-    "floodZone": <boolean or null>,
-    "recentRenovations": ["<list of recent renovations if known>"],
-    "knownIssues": ["<list of known property issues>"]
-  },
-  
-  "ownerIntel": {
-    "ownerName": "<string or null>",
-    "ownerType": "<INDIVIDUAL|LLC|TRUST|BANK|UNKNOWN>",
-    "ownerSince": "<date string or null>",
-    "mailingAddress": "<string or null>",
-    "phoneNumbers": ["<list of phone numbers if found>"],
-    "emailAddresses": ["<list of emails if found>"],
-    "businessRecords": [{"businessName": "", "status": "", "type": "", "registrationDate": null}],
-    "estimatedIncome": "<string estimate or null>",
-    "likelyToSell": <boolean or null>,
-    "motivationFactors": ["<factors that might motivate renovation or sale>"]
-  },
-  
-  "financialIntel": {
-    "estimatedEquity": <number or null>,
-    "mortgageBalance": <number or null>,
-    "lienAmount": <total lien amount or null>,
-    "liens": [{"type": "", "amount": 0, "creditor": "", "filedDate": "", "status": ""}],
-    "taxDelinquent": <boolean>,
-    "taxOwed": <number or null>,
-    "foreclosureStatus": "<string or null>",
-    "bankruptcyHistory": <boolean or null>,
-    "financingLikelihood": "<LOW|MEDIUM|HIGH>"
-  },
-  
-  "permitHistory": {
-    "totalPermits": <number>,
-    "recentPermits": [{"type": "", "description": "", "issueDate": "", "status": "", "estimatedCost": null, "contractor": null}],
-    "activePermits": <number>,
-    "lastPermitDate": "<string or null>",
-    "permitTypes": ["<list of permit types seen>"],
-    "codeViolations": [{"type": "", "description": "", "date": "", "status": "", "fineAmount": null}]
-  },
-  
-  "renovationOpps": [
-    {
-      "area": "<Kitchen|Bathroom|Roof|HVAC|Windows|Flooring|Exterior|Landscaping|etc>",
-      "description": "<specific opportunity description>",
-      "estimatedCost": {"min": 0, "max": 0},
-      "estimatedValueAdd": {"min": 0, "max": 0},
-      "roi": <percentage as number>,
-      "priority": "<LOW|MEDIUM|HIGH|CRITICAL>",
-      "timelineWeeks": {"min": 0, "max": 0},
-      "complexity": "<SIMPLE|MODERATE|COMPLEX>",
-      "permits_required": <boolean>
-    }
-  ],
-  
-  "salesApproach": {
-    "recommendedApproach": "<strategic approach for this lead>",
-    "keyTalkingPoints": ["<key points to mention>"],
-    "painPoints": ["<likely owner pain points>"],
-    "objectionHandlers": [{"objection": "<common objection>", "response": "<recommended response>"}],
-    "bestContactTime": "<recommendation or null>",
-    "preferredContactMethod": "<PHONE|EMAIL|TEXT|IN_PERSON|UNKNOWN>",
-    "urgencyLevel": "<LOW|MEDIUM|HIGH|IMMEDIATE>",
-    "followUpCadence": "<recommended follow-up schedule>"
-  }
-}`;
+    const prompt = `${LEAD_INTEL_PROMPT_INTRO}\n\nAddress: ${address}\n\nSearch Results:\n${context}\n\n${LEAD_INTEL_PROMPT_INSTRUCTIONS}`;
 
     try {
       const response = await this.aiProvider.generateLeadIntelligence(prompt);
@@ -7,6 +7,12 @@
 import { NotificationType, ReminderType } from '@prisma/client';
 import prisma from '../../lib/prisma';
 
+// Built once - Intl formatter construction is costly relative to format()
+const currencyFormatter = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+});
+
 export interface SendNotificationInput {
   userId: string;
   type: NotificationType;
@@ -66,17 +72,21 @@ export class NotificationService {
 
     const sentVia: string[] = [];
 
-    // Send via each channel
+    // Email and SMS go to different providers - send them concurrently
+    const sends: Promise<boolean>[] = [];
+
     if (channels.includes('email') && user.emailNotifications && user.email) {
-      await this.sendEmail(user.email, title, message);
+      sends.push(this.sendEmail(user.email, title, message));
       sentVia.push('email');
     }
 
     if (channels.includes('sms') && user.smsNotifications && user.phone) {
-      await this.sendSMS(user.phone, message);
+      sends.push(this.sendSMS(user.phone, message));
       sentVia.push('sms');
     }
 
+    await Promise.all(sends);
+
     // Always create in-app notification
     const notification = await prisma.notification.create({
       data: {
@@ -271,12 +281,19 @@ export class NotificationService {
 
     console.log(`Processing ${pendingTasks.length} pending reminders`);
 
-    for (const task of pendingTasks) {
-      try {
-        await this.sendTaskReminder(task.id);
-      } catch (error) {
-        console.error(`Failed to send reminder for task ${task.id}:`, error);
-      }
+    // Send in bounded batches - fully sequential stacks up to 100 RTTs,
+    // fully parallel would flood the DB pool and provider rate limits
+    const batchSize = 8;
+    for (let i = 0; i < pendingTasks.length; i += batchSize) {
+      const batch = pendingTasks.slice(i, i + batchSize);
+      const results = await Promise.allSettled(
+        batch.map(task => this.sendTaskReminder(task.id))
+      );
+      results.forEach((result, index) => {
+        if (result.status === 'rejected') {
+          console.error(`Failed to send reminder for task ${batch[index].id}:`, result.reason);
+        }
+      });
     }
 
     return pendingTasks.length;
@@ -320,10 +337,7 @@ export class NotificationService {
 
     if (!invoice) return;
 
-    const formattedAmount = new Intl.NumberFormat('en-US', {
-      style: 'currency',
-      currency: 'USD',
-    }).format(amount);
+    const formattedAmount = currencyFormatter.format(amount);
 
     await this.sendNotification({
       userId: invoice.userId,
@@ -34,6 +34,38 @@ interface TavilyResponse {
   answer?: string;
 }
 
+// Fixed domain filters for the specialty searches, allocated once
+const LISTING_SEARCH_DOMAINS = [
+  'zillow.com',
+  'redfin.com',
+  'realtor.com',
+  'trulia.com',
+  'homes.com',
+  'movoto.com',
+];
+
+const MARKET_SEARCH_DOMAINS = [
+  'zillow.com',
+  'redfin.com',
+  'realtor.com',
+  'nar.realtor',
+  'noradarealestate.com',
+];
+
+const NEIGHBORHOOD_SEARCH_DOMAINS = [
+  'walkscore.com',
+  'greatschools.org',
+  'niche.com',
+  'areavibes.com',
+  'neighborhoodscout.com',
+];
+
+const COMPS_SEARCH_DOMAINS = [
+  'zillow.com',
+  'redfin.com',
+  'realtor.com',
+];
+
 export class TavilyProvider {
   private apiKey: string;
   private baseUrl = 'https://api.tavily.com';
@@ -131,14 +163,7 @@ export class TavilyProvider {
     return this.search(query, {
       searchDepth: 'advanced',
       maxResults: 10,
-      includeDomains: [
-        'zillow.com',
-        'redfin.com',
-        'realtor.com',
-        'trulia.com',
-        'homes.com',
-        'movoto.com',
-      ],
+      includeDomains: LISTING_SEARCH_DOMAINS,
     });
   }
 
@@ -151,13 +176,7 @@ export class TavilyProvider {
     return this.search(query, {
       searchDepth: 'advanced',
       maxResults: 8,
-      includeDomains: [
-        'zillow.com',
-        'redfin.com',
-        'realtor.com',
-        'nar.realtor',
-        'noradarealestate.com',
-      ],
+      includeDomains: MARKET_SEARCH_DOMAINS,
     });
   }
 
@@ -170,13 +189,7 @@ export class TavilyProvider {
     return this.search(query, {
       searchDepth: 'advanced',
       maxResults: 8,
-      includeDomains: [
-        'walkscore.com',
-        'greatschools.org',
-        'niche.com',
-        'areavibes.com',
-        'neighborhoodscout.com',
-      ],
+      includeDomains: NEIGHBORHOOD_SEARCH_DOMAINS,
     });
   }
 
@@ -189,11 +202,7 @@ export class TavilyProvider {
     return this.search(query, {
       searchDepth: 'advanced',
       maxResults: 10,
-      includeDomains: [
-        'zillow.com',
-        'redfin.com',
-        'realtor.com',
-      ],
+      includeDomains: COMPS_SEARCH_DOMAINS,
     });
   }
 
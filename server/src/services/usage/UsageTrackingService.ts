@@ -4,6 +4,7 @@
  */
 
 import prisma from '../../lib/prisma';
+import { CacheService } from '../cache/CacheService';
 
 interface UsageMetrics {
   aiCalls: number;
@@ -57,7 +58,40 @@ export class UsageTrackingService {
   // Cost structure
   private readonly AI_COST_PER_CALL = 0.05; // $0.05 per AI analysis
   private readonly STORAGE_COST_PER_GB = 0.10; // $0.10 per GB per month
-  
+
+  // Subscription tiers change rarely but are read by several methods - the
+  // usage dashboard alone triggers four identical user lookups per request.
+  // A short TTL keeps a tier change visible within five minutes.
+  private tierCache = new CacheService(5, 500);
+
+  /**
+   * Get a user's subscription tier, cached for a few minutes
+   */
+  private async getSubscriptionTier(userId: string): Promise<string> {
+    const cached = this.tierCache.get<string>(userId);
+    if (cached) return cached;
+
+    const user = await prisma.user.findUnique({
+      where: { id: userId },
+      select: { subscriptionTier: true },
+    });
+
+    if (!user) {
+      throw new Error('User not found');
+    }
+
+    this.tierCache.set(userId, user.subscriptionTier);
+    return user.subscriptionTier;
+  }
+
+  /**
+   * Drop the cached tier for a user (call after a plan change)
+   */
+  invalidateTier(userId: string): void {
+    this.tierCache.delete(userId);
+  }
+
+
   /**
    * Track AI usage for a user
    */
@@ -136,16 +170,9 @@ export class UsageTrackingService {
     storageLimit: number;
     message?: string;
   }> {
-    const user = await prisma.user.findUnique({
-      where: { id: userId },
-      select: { subscriptionTier: true },
-    });
-
-    if (!user) {
-      throw new Error('User not found');
-    }
+    const subscriptionTier = await this.getSubscriptionTier(userId);
 
-    const tier = this.PRICING_TIERS[user.subscriptionTier];
+    const tier = this.PRICING_TIERS[subscriptionTier];
     const monthlyUsage = await this.getMonthlyUsage(userId);
 
     const aiWithinLimit = tier.aiCallsLimit === -1 || monthlyUsage.aiCalls < tier.aiCallsLimit;
@@ -213,16 +240,9 @@ export class UsageTrackingService {
     profit: number;
     profitMargin: number;
   }> {
-    const user = await prisma.user.findUnique({
-      where: { id: userId },
-      select: { subscriptionTier: true },
-    });
+    const subscriptionTier = await this.getSubscriptionTier(userId);
 
-    if (!user) {
-      throw new Error('User not found');
-    }
-
-    const tier = this.PRICING_TIERS[user.subscriptionTier];
+    const tier = this.PRICING_TIERS[subscriptionTier];
     const monthlyUsage = await this.getMonthlyUsage(userId);
 
     const revenue = tier.monthlyPrice;
@@ -254,17 +274,8 @@ export class UsageTrackingService {
     recommendedTier: string;
     reason: string;
   }> {
-    const user = await prisma.user.findUnique({
-      where: { id: userId },
-      select: { subscriptionTier: true },
-    });
-
-    if (!user) {
-      throw new Error('User not found');
-    }
-
+    const currentTier = await this.getSubscriptionTier(userId);
     const limits = await this.checkUsageLimits(userId);
-    const currentTier = user.subscriptionTier;
 
     if (!limits.withinLimits) {
       const nextTier = this.getNextTier(currentTier);
@@ -304,3 +315,6 @@ export class UsageTrackingService {
     return currentIndex < tiers.length - 1 ? tiers[currentIndex + 1] : currentTier;
   }
 }
+
+// Export singleton instance so all consumers share the tier cache
+export const usageTrackingService = new UsageTrackingService();
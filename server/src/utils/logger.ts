@@ -0,0 +1,34 @@
+/**
+ * Level-Gated Logger
+ * Thin wrapper over console that honors LOG_LEVEL so per-request chatter
+ * (cache hits, provider calls) can be silenced in production. console.log
+ * writes synchronously to stdout on Cloud Run, so hot-path logging should
+ * go through debug() and default to off.
+ */
+
+const LEVELS = ['debug', 'info', 'warn', 'error'] as const;
+
+export type LogLevel = (typeof LEVELS)[number];
+
+function resolveLevel(): number {
+  const configured = (process.env.LOG_LEVEL || 'info').toLowerCase();
+  const index = LEVELS.indexOf(configured as LogLevel);
+  return index === -1 ? LEVELS.indexOf('info') : index;
+}
+
+const activeLevel = resolveLevel();
+
+export const logger = {
+  debug(...args: unknown[]): void {
+    if (activeLevel <= 0) console.log(...args);
+  },
+  info(...args: unknown[]): void {
+    if (activeLevel <= 1) console.log(...args);
+  },
+  warn(...args: unknown[]): void {
+    if (activeLevel <= 2) console.warn(...args);
+  },
+  error(...args: unknown[]): void {
+    console.error(...args);
+  },
+};